@@ -4,274 +4,740 @@ GitHub Stats CLI: A simple tool to fetch and display GitHub user statistics.
 """
 
 import argparse
+import atexit
 import csv
+import html
 import io
 import json
-import matplotlib.pyplot as plt
 import os
-import requests
+import random
 import sqlite3
+import sys
+import threading
 import time
-from datetime import datetime
-from tabulate import tabulate
-from tqdm import tqdm
-import yaml
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
 CACHE_FILE = ".cache.json"
+CACHE_LOG = ".cache.jsonl"
 CACHE_EXPIRY = 3600  # 1 hour
+STALE_CACHE_EXPIRY = 10 * CACHE_EXPIRY  # Oldest entry served when GitHub is unreachable
+DB_FILE = "github_stats.db"
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+MAX_WORKERS = 8  # Concurrent GitHub API requests per batch
+MAX_IN_FLIGHT = 16  # Concurrent GitHub API requests per process, across all batches
+GRAPHQL_BATCH_SIZE = 20  # Users per aliased GraphQL query
+CONTRIBUTOR_REPOS = 3  # Top repositories covered by --contributors
+REQUEST_TIMEOUT = 10  # Seconds to wait on a GitHub API connection or read
+RETRY_ATTEMPTS = 4  # Tries for a request that fails to connect or is answered with 429/503
+RATE_LIMIT_FLOOR = 2  # Pause new requests once this few remain in the window
+MAX_RATE_LIMIT_WAIT = 60  # Longest pause (seconds) for the window to reset
+OUTPUT_BUFFER_SIZE = 64 * 1024  # Write buffer for exported files
+MAX_REPOS_LIMIT = 100  # Largest page of repositories GitHub returns
+
+_CACHE = None
+_CACHE_LOG_ENTRIES = 0
+_CACHE_LOG_FILE = None
+_CACHE_LOCK = threading.Lock()
+
+_CONN = None
+_DB_LOCK = threading.RLock()
+_SCHEMA_READY = False
+
+_FIGURE = None
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+NETWORK_ERRORS = ()  # Transport exception types of the active HTTP client
+
+_RATE_LIMITS = {}  # (Authorization, resource) -> (remaining, reset epoch) from the last response
+_RATE_LIMIT_LOCK = threading.Lock()
+_IN_FLIGHT = None  # BoundedSemaphore of MAX_IN_FLIGHT, made on first request
+
+def _new_session():
+    """Build the shared HTTP client: HTTP/2 via httpx when installed, else requests."""
+    # Heavy third-party modules are imported on first use to keep CLI startup fast
+    try:
+        import h2  # noqa: F401 (httpx needs it for HTTP/2)
+        import httpx
+    except ImportError:
+        pass
+    else:
+        # Concurrent calls multiplex as streams over a single TLS connection
+        transport = httpx.HTTPTransport(http2=True, limits=httpx.Limits(max_connections=MAX_IN_FLIGHT))
+        client = httpx.Client(transport=transport, follow_redirects=True,
+                              headers={"Accept": "application/vnd.github+json"})
+        return client, (httpx.HTTPError,)
+    
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    # Accept-Encoding is left to the client, which offers br/zstd only when their decoders are installed
+    session.headers.update({"Accept": "application/vnd.github+json"})
+    # No adapter retries: _api_request retries transport errors and status codes itself,
+    # capping the wait and never holding an _IN_FLIGHT slot while it sleeps
+    session.mount("https://", HTTPAdapter(pool_connections=MAX_IN_FLIGHT, pool_maxsize=MAX_IN_FLIGHT))
+    return session, (requests.RequestException,)
+
+def _get_session():
+    """Return the pooled, keep-alive client shared by every GitHub API call."""
+    global _SESSION, NETWORK_ERRORS, _IN_FLIGHT
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION, NETWORK_ERRORS = _new_session()
+        # Built here rather than at import, so it is a cooperative lock when a gevent worker
+        # (even one loading the app with gunicorn --preload) monkey-patches threading first
+        if _IN_FLIGHT is None:
+            _IN_FLIGHT = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+        return _SESSION
+
+def _rate_limit_resource(url: str) -> str:
+    """Name of the GitHub rate-limit bucket a request URL draws from."""
+    if url == GRAPHQL_URL:
+        return "graphql"
+    if "/search/" in url:
+        return "search"
+    return "core"
+
+def _record_rate_limit(response, auth: str = None):
+    """Remember the remaining quota and reset time GitHub reported for this credential."""
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    if remaining is None:
+        return
+    resource = response.headers.get("X-RateLimit-Resource", "core")
+    with _RATE_LIMIT_LOCK:
+        _RATE_LIMITS[auth, resource] = (int(remaining), int(response.headers.get("X-RateLimit-Reset", 0)))
+
+def _wait_for_rate_limit(resource: str, auth: str = None):
+    """Sleep until the quota resets when this credential's is nearly spent and the reset is close."""
+    # Quotas are per token (or per IP without one), so one exhausted token mustn't pace the others
+    with _RATE_LIMIT_LOCK:
+        remaining, reset = _RATE_LIMITS.get((auth, resource), (None, 0))
+    if remaining is None or remaining > RATE_LIMIT_FLOOR:
+        return
+    delay = reset - time.time()
+    if 0 < delay <= MAX_RATE_LIMIT_WAIT:
+        time.sleep(delay + 1)
+
+def _retry_delay(response, attempt: int):
+    """Seconds to wait before retrying response, or None if it should not be retried."""
+    retry_after = response.headers.get("Retry-After")
+    exhausted = response.headers.get("X-RateLimit-Remaining") == "0"
+    # A 403 carrying Retry-After is GitHub's secondary (abuse) rate limit; one with
+    # no quota left is the primary limit, which lifts at X-RateLimit-Reset
+    if response.status_code not in (429, 503) and not (response.status_code == 403 and (retry_after or exhausted)):
+        return None
+    try:
+        delay = int(retry_after)
+    except (TypeError, ValueError):
+        if exhausted:
+            delay = int(response.headers.get("X-RateLimit-Reset", 0)) - time.time() + 1
+        else:
+            delay = 2 ** attempt + random.random()
+    return max(delay, 0) if delay <= MAX_RATE_LIMIT_WAIT else None
+
+def _api_request(method: str, url: str, **kwargs):
+    """Send a GitHub API request, pacing on rate-limit headers and backing off on transport errors and 429/503."""
+    session = _get_session()
+    resource = _rate_limit_resource(url)
+    auth = (kwargs.get("headers") or {}).get("Authorization")
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    for attempt in range(RETRY_ATTEMPTS):
+        _wait_for_rate_limit(resource, auth)
+        # Concurrent web requests each run their own pools; cap what reaches GitHub at once,
+        # holding a slot only for the attempt itself
+        try:
+            with _IN_FLIGHT:
+                response = session.request(method, url, **kwargs)
+        except NETWORK_ERRORS:  # Looked up once raised, after the client exists
+            if attempt == RETRY_ATTEMPTS - 1:
+                raise
+            time.sleep(0.5 * 2 ** attempt)
+            continue
+        _record_rate_limit(response, auth)
+        delay = _retry_delay(response, attempt)
+        if delay is None or attempt == RETRY_ATTEMPTS - 1:
+            return response
+        time.sleep(delay)
+
+def json_loads(raw):
+    """Decode JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def json_dumpb(obj, pretty: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode()
+
+def json_dumps(obj, pretty: bool = False) -> str:
+    """Encode obj as JSON text, using orjson when it is installed."""
+    return json_dumpb(obj, pretty).decode()
+
+def _merge_cache_entry(cache, key, entry):
+    """Store entry under key unless cache already holds a newer one."""
+    current = cache.get(key)
+    if current is None or current[1] <= entry[1]:
+        cache[key] = entry
+
+def _replay_cache_log(path, cache) -> int:
+    """Fold a cache log's entries into cache, newest per key; returns how many lines were read."""
+    count = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                key, *entry = json_loads(line)
+            except ValueError:
+                continue  # Torn last line from an interrupted run
+            _merge_cache_entry(cache, key, entry)
+            count += 1
+    return count
 
 def load_cache():
-    if os.path.exists(CACHE_FILE):
-        with open(CACHE_FILE, "r") as f:
-            return json.load(f)
-    return {}
+    """Return the in-memory cache, loading the snapshot and replaying the log on first use."""
+    global _CACHE, _CACHE_LOG_ENTRIES
+    if _CACHE is None:
+        cache = {}
+        if os.path.exists(CACHE_FILE):
+            with open(CACHE_FILE, "rb") as f:
+                cache = json_loads(f.read())
+        if os.path.exists(CACHE_LOG):
+            _CACHE_LOG_ENTRIES += _replay_cache_log(CACHE_LOG, cache)
+        _CACHE = cache
+        atexit.register(flush_cache)
+    return _CACHE
 
 def save_cache(cache):
-    with open(CACHE_FILE, "w") as f:
-        json.dump(cache, f)
-
-def init_database():
-    """Initialize SQLite database for historical data."""
-    conn = sqlite3.connect('github_stats.db')
-    cursor = conn.cursor()
-    
-    # Create tables
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS user_stats (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT NOT NULL,
-            date TEXT NOT NULL,
-            followers INTEGER,
-            following INTEGER,
-            public_repos INTEGER,
-            public_gists INTEGER
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS repo_stats (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT NOT NULL,
-            repo_name TEXT NOT NULL,
-            date TEXT NOT NULL,
-            stars INTEGER,
-            forks INTEGER,
-            open_issues INTEGER,
-            language TEXT
-        )
-    ''')
-    
-    conn.commit()
-    conn.close()
+    """Write a full cache snapshot that supersedes the append-only log, safely against crashes and other writers."""
+    # Rotate the log aside rather than deleting it, so entries other processes appended
+    # since this one loaded are folded in; their writers notice and reopen a fresh log
+    rotated = f"{CACHE_LOG}.{os.getpid()}"
+    try:
+        os.replace(CACHE_LOG, rotated)
+    except FileNotFoundError:
+        rotated = None
+    
+    merged = {}
+    if os.path.exists(CACHE_FILE):
+        with open(CACHE_FILE, "rb") as f:
+            merged = json_loads(f.read())
+    if rotated:
+        _replay_cache_log(rotated, merged)
+    for key, entry in cache.items():
+        _merge_cache_entry(merged, key, entry)
+    
+    # Write beside the snapshot and swap it in, so a crash never leaves a torn cache file
+    tmp_file = f"{CACHE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(json_dumpb(merged))
+    os.replace(tmp_file, CACHE_FILE)
+    if rotated:
+        os.remove(rotated)
+
+def _cache_log_rotated(f) -> bool:
+    """Whether the log open as f has been rotated away by another process's compaction."""
+    try:
+        return os.stat(CACHE_LOG).st_ino != os.fstat(f.fileno()).st_ino
+    except FileNotFoundError:
+        return True
+
+def flush_cache():
+    """Close the cache log, compacting it into the snapshot once it is mostly superseded entries."""
+    global _CACHE_LOG_ENTRIES, _CACHE_LOG_FILE
+    with _CACHE_LOCK:
+        if _CACHE_LOG_FILE is not None:
+            _CACHE_LOG_FILE.close()
+            _CACHE_LOG_FILE = None
+        if _CACHE is not None and _CACHE_LOG_ENTRIES > 2 * len(_CACHE):
+            save_cache(_CACHE)
+            _CACHE_LOG_ENTRIES = 0
+
+SCHEMA_SQL = '''
+    CREATE TABLE IF NOT EXISTS user_stats (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT NOT NULL,
+        date TEXT NOT NULL,
+        followers INTEGER,
+        following INTEGER,
+        public_repos INTEGER,
+        public_gists INTEGER
+    );
+    
+    CREATE TABLE IF NOT EXISTS repo_stats (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT NOT NULL,
+        repo_name TEXT NOT NULL,
+        date TEXT NOT NULL,
+        stars INTEGER,
+        forks INTEGER,
+        open_issues INTEGER,
+        language TEXT
+    );
+    
+    -- Let history lookups walk the index in date order and stop after LIMIT rows
+    CREATE INDEX IF NOT EXISTS idx_user_stats_username_date
+    ON user_stats (username, date DESC);
+    
+    CREATE INDEX IF NOT EXISTS idx_repo_stats_username_date
+    ON repo_stats (username, date DESC);
+'''
+
+def _get_conn():
+    """Return the shared stats database connection, opening it on first use."""
+    global _CONN
+    with _DB_LOCK:
+        if _CONN is None:
+            conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            init_database(conn)
+            atexit.register(conn.close)
+            _CONN = conn
+        return _CONN
+
+def init_database(conn=None):
+    """Initialize SQLite database for historical data, once per process."""
+    global _SCHEMA_READY
+    if conn is None:
+        conn = _get_conn()
+    with _DB_LOCK:
+        if not _SCHEMA_READY:
+            conn.executescript(SCHEMA_SQL)
+            _SCHEMA_READY = True
 
 def save_user_stats_to_db(username: str, data: Dict[str, Any]):
     """Save user stats to database."""
-    init_database()
-    conn = sqlite3.connect('github_stats.db')
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        INSERT INTO user_stats (username, date, followers, following, public_repos, public_gists)
-        VALUES (?, ?, ?, ?, ?, ?)
-    ''', (
-        username,
-        datetime.now().isoformat(),
-        data.get('followers', 0),
-        data.get('following', 0),
-        data.get('public_repos', 0),
-        data.get('public_gists', 0)
-    ))
-    
-    conn.commit()
-    conn.close()
+    conn = _get_conn()
+    
+    with _DB_LOCK, conn:
+        conn.execute('''
+            INSERT INTO user_stats (username, date, followers, following, public_repos, public_gists)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (
+            username,
+            datetime.now().isoformat(),
+            data.get('followers', 0),
+            data.get('following', 0),
+            data.get('public_repos', 0),
+            data.get('public_gists', 0)
+        ))
 
 def save_repo_stats_to_db(username: str, repos: list):
-    """Save repository stats to database."""
-    init_database()
-    conn = sqlite3.connect('github_stats.db')
-    cursor = conn.cursor()
+    """Save repository stats to database in a single transaction."""
+    conn = _get_conn()
     
-    for repo in repos:
-        cursor.execute('''
-            INSERT INTO repo_stats (username, repo_name, date, stars, forks, open_issues, language)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    now = datetime.now().isoformat()
+    rows = [
+        (
             username,
             repo.get('name', ''),
-            datetime.now().isoformat(),
+            now,
             repo.get('stargazers_count', 0),
             repo.get('forks_count', 0),
             repo.get('open_issues_count', 0),
             repo.get('language', '')
-        ))
+        ) for repo in repos
+    ]
     
-    conn.commit()
-    conn.close()
+    with _DB_LOCK, conn:
+        conn.executemany('''
+            INSERT INTO repo_stats (username, repo_name, date, stars, forks, open_issues, language)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
 
 def get_user_history(username: str, days: int = 30):
     """Get historical user stats."""
-    init_database()
-    conn = sqlite3.connect('github_stats.db')
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT date, followers, following, public_repos, public_gists
-        FROM user_stats
-        WHERE username = ?
-        ORDER BY date DESC
-        LIMIT ?
-    ''', (username, days))
-    
-    history = cursor.fetchall()
-    conn.close()
+    conn = _get_conn()
+    
+    with _DB_LOCK:
+        cursor = conn.execute('''
+            SELECT date, followers, following, public_repos, public_gists
+            FROM user_stats
+            WHERE username = ?
+            ORDER BY date DESC
+            LIMIT ?
+        ''', (username, days))
+        history = cursor.fetchall()
+    
     return history
 
+def get_cache_entry(key):
+    """Return the cached (data, timestamp, etag) for key, or None."""
+    with _CACHE_LOCK:
+        entry = load_cache().get(key)
+    if entry is None:
+        return None
+    # Entries written before ETag support only hold (data, timestamp)
+    data, timestamp, *rest = entry
+    return data, timestamp, rest[0] if rest else None
+
 def get_cached_data(key, max_age=CACHE_EXPIRY):
-    cache = load_cache()
-    if key in cache:
-        data, timestamp = cache[key]
+    entry = get_cache_entry(key)
+    if entry is not None:
+        data, timestamp, _ = entry
         if time.time() - timestamp < max_age:
             return data
     return None
 
-def set_cached_data(key, data):
-    cache = load_cache()
-    cache[key] = (data, time.time())
-    save_cache(cache)
+def set_cached_data(key, data, etag=None):
+    global _CACHE_LOG_ENTRIES, _CACHE_LOG_FILE
+    entry = (data, time.time(), etag)
+    with _CACHE_LOCK:
+        load_cache()[key] = entry
+        # Append one line to a log kept open for the run instead of rewriting the whole cache file;
+        # unbuffered, so each entry is durable and lands in one O_APPEND write even with several writers
+        if _CACHE_LOG_FILE is not None and _cache_log_rotated(_CACHE_LOG_FILE):
+            _CACHE_LOG_FILE.close()
+            _CACHE_LOG_FILE = None
+        if _CACHE_LOG_FILE is None:
+            _CACHE_LOG_FILE = open(CACHE_LOG, "ab", buffering=0)
+        _CACHE_LOG_FILE.write(json_dumpb([key, *entry]) + b"\n")
+        _CACHE_LOG_ENTRIES += 1
+
+def _cached_get(url: str, cache_key: str, token: str = None):
+    """Fetch a GitHub API URL through the cache, revalidating stale entries by ETag.
+
+    Returns (data, response). data is the cached payload when it is still fresh,
+    GitHub answered 304 Not Modified, or GitHub is unreachable or failing and the
+    entry is within STALE_CACHE_EXPIRY; otherwise None and the caller handles response.
+    """
+    entry = get_cache_entry(cache_key)
+    if entry is not None:
+        data, timestamp, etag = entry
+        if time.time() - timestamp < CACHE_EXPIRY:
+            return data, None
+    
+    headers = {"Authorization": f"token {token}"} if token else {}
+    if entry is not None and etag:
+        headers["If-None-Match"] = etag
+    stale_ok = entry is not None and time.time() - timestamp < STALE_CACHE_EXPIRY
+    try:
+        response = _api_request("GET", url, headers=headers)
+    except NETWORK_ERRORS:
+        # GitHub unreachable: an expired copy beats failing outright
+        if stale_ok:
+            return data, None
+        raise
+    if response.status_code >= 500 and stale_ok:
+        return data, response
+    if response.status_code == 304:
+        # Not modified: conditional requests don't count against the rate limit
+        set_cached_data(cache_key, data, etag)
+        return data, response
+    return None, response
+
+def clamp_max_repos(max_repos: int) -> int:
+    """Bound a requested repository count to what one GitHub page can hold."""
+    return max(1, min(max_repos, MAX_REPOS_LIMIT))
 
 def get_user_stats(username: str, token: str = None) -> Dict[str, Any]:
     """Fetch basic user statistics from GitHub API."""
     cache_key = f"user_{username}_{token or 'no_token'}"
-    cached = get_cached_data(cache_key)
-    if cached:
-        return cached
-    
     url = f"https://api.github.com/users/{username}"
-    headers = {"Authorization": f"token {token}"} if token else None
-    response = requests.get(url, headers=headers)
+    cached, response = _cached_get(url, cache_key, token)
+    if cached is not None:
+        return cached
     if response.status_code == 404:
         raise ValueError(f"User '{username}' not found on GitHub.")
     elif response.status_code == 403:
         raise ValueError("API rate limit exceeded. Try again later or use a personal access token.")
     elif response.status_code != 200:
         raise ValueError(f"Failed to fetch user data: {response.status_code} - {response.text}")
-    data = response.json()
-    set_cached_data(cache_key, data)
+    data = json_loads(response.content)
+    set_cached_data(cache_key, data, response.headers.get("ETag"))
     return data
 
 def get_org_stats(orgname: str, token: str = None) -> Dict[str, Any]:
     """Fetch basic organization statistics from GitHub API."""
     cache_key = f"org_{orgname}_{token or 'no_token'}"
-    cached = get_cached_data(cache_key)
-    if cached:
-        return cached
-    
     url = f"https://api.github.com/orgs/{orgname}"
-    headers = {"Authorization": f"token {token}"} if token else None
-    response = requests.get(url, headers=headers)
+    cached, response = _cached_get(url, cache_key, token)
+    if cached is not None:
+        return cached
     if response.status_code == 404:
         raise ValueError(f"Organization '{orgname}' not found on GitHub.")
     elif response.status_code == 403:
         raise ValueError("API rate limit exceeded. Try again later or use a personal access token.")
     elif response.status_code != 200:
         raise ValueError(f"Failed to fetch org data: {response.status_code} - {response.text}")
-    data = response.json()
-    set_cached_data(cache_key, data)
+    data = json_loads(response.content)
+    set_cached_data(cache_key, data, response.headers.get("ETag"))
     return data
 
 def get_user_repos(username: str, max_repos: int = 10, token: str = None, since: str = None) -> list:
     """Fetch user's repositories, sorted by stars."""
+    max_repos = clamp_max_repos(max_repos)
     cache_key = f"repos_{username}_{max_repos}_{token or 'no_token'}_{since or 'no_since'}"
-    cached = get_cached_data(cache_key)
-    if cached:
-        return cached
-    
     url = f"https://api.github.com/users/{username}/repos?sort=stars&per_page={max_repos}"
     if since:
         url += f"&since={since}T00:00:00Z"
-    headers = {"Authorization": f"token {token}"} if token else None
-    response = requests.get(url, headers=headers)
+    cached, response = _cached_get(url, cache_key, token)
+    if cached is not None:
+        return cached
     if response.status_code == 404:
         raise ValueError(f"User '{username}' not found on GitHub.")
     elif response.status_code == 403:
         raise ValueError("API rate limit exceeded. Try again later or use a personal access token.")
     elif response.status_code != 200:
         raise ValueError(f"Failed to fetch repos: {response.status_code} - {response.text}")
-    data = response.json()
-    set_cached_data(cache_key, data)
+    data = json_loads(response.content)
+    set_cached_data(cache_key, data, response.headers.get("ETag"))
+    return data
+
+def search_user_repos(username: str, max_repos: int = 10, token: str = None) -> list:
+    """Fetch a user's most-starred repositories through the search API."""
+    max_repos = clamp_max_repos(max_repos)
+    # /users/{user}/repos cannot order by stars; search can, from a single page
+    cache_key = f"search_repos_{username}_{max_repos}_{token or 'no_token'}"
+    url = f"https://api.github.com/search/repositories?q=user:{username}&sort=stars&order=desc&per_page={max_repos}"
+    cached, response = _cached_get(url, cache_key, token)
+    if cached is not None:
+        return cached
+    if response.status_code == 422:
+        raise ValueError(f"User '{username}' not found on GitHub.")
+    elif response.status_code == 403:
+        raise ValueError("API rate limit exceeded. Try again later or use a personal access token.")
+    elif response.status_code != 200:
+        raise ValueError(f"Failed to fetch repos: {response.status_code} - {response.text}")
+    data = json_loads(response.content)["items"]
+    set_cached_data(cache_key, data, response.headers.get("ETag"))
     return data
 
 def get_org_repos(orgname: str, max_repos: int = 10, token: str = None, since: str = None) -> list:
     """Fetch organization's repositories, sorted by stars."""
+    max_repos = clamp_max_repos(max_repos)
     cache_key = f"org_repos_{orgname}_{max_repos}_{token or 'no_token'}_{since or 'no_since'}"
-    cached = get_cached_data(cache_key)
-    if cached:
-        return cached
-    
     url = f"https://api.github.com/orgs/{orgname}/repos?sort=stars&per_page={max_repos}"
     if since:
         url += f"&since={since}T00:00:00Z"
-    headers = {"Authorization": f"token {token}"} if token else None
-    response = requests.get(url, headers=headers)
+    cached, response = _cached_get(url, cache_key, token)
+    if cached is not None:
+        return cached
     if response.status_code == 404:
         raise ValueError(f"Organization '{orgname}' not found on GitHub.")
     elif response.status_code == 403:
         raise ValueError("API rate limit exceeded. Try again later or use a personal access token.")
     elif response.status_code != 200:
         raise ValueError(f"Failed to fetch org repos: {response.status_code} - {response.text}")
-    data = response.json()
-    set_cached_data(cache_key, data)
+    data = json_loads(response.content)
+    set_cached_data(cache_key, data, response.headers.get("ETag"))
     return data
 
 def get_repo_contributors(owner: str, repo: str, token: str = None, max_contribs: int = 5) -> list:
     """Fetch top contributors for a repository."""
     cache_key = f"contributors_{owner}_{repo}_{max_contribs}_{token or 'no_token'}"
-    cached = get_cached_data(cache_key)
-    if cached:
-        return cached
-    
     url = f"https://api.github.com/repos/{owner}/{repo}/contributors?per_page={max_contribs}"
-    headers = {"Authorization": f"token {token}"} if token else None
-    response = requests.get(url, headers=headers)
+    cached, response = _cached_get(url, cache_key, token)
+    if cached is not None:
+        return cached
     if response.status_code == 404:
         return []
     elif response.status_code == 403:
         return []
     elif response.status_code != 200:
         return []
-    data = response.json()
-    set_cached_data(cache_key, data)
+    data = json_loads(response.content)
+    set_cached_data(cache_key, data, response.headers.get("ETag"))
     return data
 
 def get_commit_activity(owner: str, repo: str, token: str = None) -> list:
     """Fetch commit activity for a repository."""
     cache_key = f"activity_{owner}_{repo}_{token or 'no_token'}"
-    cached = get_cached_data(cache_key)
-    if cached:
-        return cached
-    
     url = f"https://api.github.com/repos/{owner}/{repo}/stats/commit_activity"
-    headers = {"Authorization": f"token {token}"} if token else None
-    response = requests.get(url, headers=headers)
+    cached, response = _cached_get(url, cache_key, token)
+    if cached is not None:
+        return cached
     if response.status_code == 404:
         return []
     elif response.status_code == 403:
         return []
     elif response.status_code != 200:
         return []
-    data = response.json()
-    set_cached_data(cache_key, data)
+    data = json_loads(response.content)
+    set_cached_data(cache_key, data, response.headers.get("ETag"))
     return data
 
+# Profile and top repositories in the shape of one GraphQL selection set
+GRAPHQL_USER_FIELDS = """
+    login name bio location createdAt
+    followers { totalCount }
+    following { totalCount }
+    gists(privacy: PUBLIC) { totalCount }
+    publicRepos: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    topRepos: repositories(first: $first, privacy: PUBLIC, ownerAffiliations: OWNER,
+                           orderBy: {field: STARGAZERS, direction: DESC}) {
+        nodes {
+            name stargazerCount forkCount updatedAt diskUsage
+            primaryLanguage { name }
+            issues(states: OPEN) { totalCount }
+            pullRequests(states: OPEN) { totalCount }
+        }
+    }
+"""
+
+def _users_bundle_query(count: int) -> str:
+    """Build one GraphQL document that fetches count users under aliases u0..uN."""
+    params = "".join([f", $u{i}: String!" for i in range(count)])
+    users = "\n".join([f"    u{i}: user(login: $u{i}) {{ {GRAPHQL_USER_FIELDS} }}" for i in range(count)])
+    return f"query($first: Int!{params}) {{\n{users}\n}}"
+
+def _graphql_user_to_rest(user: Dict[str, Any]):
+    """Map a GraphQL user node to the REST (user_data, repos) shapes."""
+    user_data = {
+        "login": user["login"],
+        "name": user["name"],
+        "bio": user["bio"],
+        "location": user["location"],
+        "followers": user["followers"]["totalCount"],
+        "following": user["following"]["totalCount"],
+        "public_repos": user["publicRepos"]["totalCount"],
+        "public_gists": user["gists"]["totalCount"],
+        "created_at": user["createdAt"],
+    }
+    repos = [
+        {
+            "name": node["name"],
+            "stargazers_count": node["stargazerCount"],
+            "language": node["primaryLanguage"]["name"] if node["primaryLanguage"] else None,
+            "forks_count": node["forkCount"],
+            # REST counts open pull requests as issues too
+            "open_issues_count": node["issues"]["totalCount"] + node["pullRequests"]["totalCount"],
+            "updated_at": node["updatedAt"],
+            "size": node["diskUsage"] or 0,
+        } for node in user["topRepos"]["nodes"]
+    ]
+    return user_data, repos
+
+def graphql_query(query: str, variables: Dict[str, Any], token: str) -> Dict[str, Any]:
+    """Run a GraphQL query against the GitHub API and return its data."""
+    if not token:
+        raise ValueError("The GitHub GraphQL API requires a personal access token.")
+    headers = {"Authorization": f"token {token}"}
+    response = _api_request("POST", GRAPHQL_URL, headers=headers, json={"query": query, "variables": variables})
+    if response.status_code == 401:
+        raise ValueError("Invalid GitHub token for the GraphQL API.")
+    elif response.status_code == 403:
+        raise ValueError("API rate limit exceeded. Try again later or use a personal access token.")
+    elif response.status_code != 200:
+        raise ValueError(f"GraphQL request failed: {response.status_code} - {response.text}")
+    result = json_loads(response.content)
+    # NOT_FOUND only nulls out its own field, which callers handle; anything else
+    # (RATE_LIMITED, timeouts, bad queries) means the data can't be trusted
+    errors = [error for error in result.get("errors") or [] if error.get("type") != "NOT_FOUND"]
+    if errors:
+        raise ValueError("GraphQL query failed: " + "; ".join(error.get("message", "unknown error") for error in errors))
+    return result
+
+def get_users_bundle_graphql(usernames: list, max_repos: int = 10, token: str = None) -> list:
+    """Fetch several users' profiles and top repositories, batching them into aliased GraphQL queries.
+
+    Returns one (user_data, repos) per login, or None where the login is not a user
+    (an organization, or no account at all); the REST fetchers can tell those apart.
+    """
+    max_repos = clamp_max_repos(max_repos)
+    bundles = {}
+    pending = []
+    for username in dict.fromkeys(usernames):
+        cached = get_cached_data(f"graphql_user_{username}_{max_repos}_{token or 'no_token'}")
+        if cached is not None:
+            bundles[username] = tuple(cached)
+        else:
+            pending.append(username)
+    
+    for start in range(0, len(pending), GRAPHQL_BATCH_SIZE):
+        batch = pending[start:start + GRAPHQL_BATCH_SIZE]
+        variables = {"first": max_repos, **{f"u{i}": username for i, username in enumerate(batch)}}
+        result = graphql_query(_users_bundle_query(len(batch)), variables, token).get("data") or {}
+        for i, username in enumerate(batch):
+            user = result.get(f"u{i}")
+            if user is None:
+                bundles[username] = None
+                continue
+            bundles[username] = _graphql_user_to_rest(user)
+            set_cached_data(f"graphql_user_{username}_{max_repos}_{token or 'no_token'}", bundles[username])
+    
+    return [bundles[username] for username in usernames]
+
+def get_user_bundle_graphql(username: str, max_repos: int = 10, token: str = None):
+    """Fetch a user's profile and top repositories with one GraphQL query, or None if the login is not a user."""
+    return get_users_bundle_graphql([username], max_repos, token)[0]
+
 def get_rate_limit(token: str = None) -> Dict[str, Any]:
     """Get current GitHub API rate limit status."""
     url = "https://api.github.com/rate_limit"
     headers = {"Authorization": f"token {token}"} if token else None
-    response = requests.get(url, headers=headers)
+    response = _api_request("GET", url, headers=headers)
     if response.status_code != 200:
         return {}
-    return response.json()
+    return json_loads(response.content)
+
+def summarize_commit_activity(activity: list, recent: int = 12):
+    """Return total commits and the per-week totals for the most recent weeks."""
+    weekly = [week['total'] for week in activity]
+    return sum(weekly), weekly[-recent:]
+
+def project_repo(repo: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a GitHub API repository onto the fields shown in reports."""
+    return {
+        "name": repo["name"],
+        "stars": repo["stargazers_count"],
+        "language": repo["language"] or "N/A",
+        "forks": repo["forks_count"],
+        "open_issues": repo["open_issues_count"],
+        "updated_at": repo["updated_at"],
+        "size": repo.get("size", 0)
+    }
+
+def calculate_health_score(repo: Dict[str, Any], now: datetime) -> int:
+    """Simple repository health score, with a bonus for updates in the last 30 days."""
+    health = repo["stars"] * 2 + repo["forks"] * 3 - repo["open_issues"]
+    try:
+        updated = datetime.fromisoformat(repo["updated_at"].replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return health
+    if (now - updated).days <= 30:
+        health += 10
+    return health
+
+USER_SUMMARY = """GitHub Stats for: {username}
+Name: {name}
+Bio: {bio}
+Location: {location}
+Followers: {followers}
+Following: {following}
+Public Repos: {public_repos}
+Public Gists: {public_gists}
+Account Created: {created_at}
+
+Top Repositories (by stars):
+{repo_table}"""
+
+ORG_SUMMARY = """GitHub Stats for: {orgname} (Organization)
+Name: {name}
+Description: {description}
+Location: {location}
+Public Members: {public_members}
+Followers: {followers}
+Following: {following}
+Public Repos: {public_repos}
+Created At: {created_at}
+
+Top Repositories (by stars):
+{repo_table}"""
 
 def display_org_stats(org_data: Dict[str, Any], repos: list, print_flag: bool = True) -> Dict[str, Any]:
     """Display the fetched org stats in a readable format and return data."""
@@ -285,38 +751,26 @@ def display_org_stats(org_data: Dict[str, Any], repos: list, print_flag: bool =
         "following": org_data['following'],
         "public_repos": org_data['public_repos'],
         "created_at": org_data['created_at'],
-        "top_repositories": [
-            {
-                "name": repo["name"],
-                "stars": repo["stargazers_count"],
-                "language": repo["language"],
-                "forks": repo["forks_count"],
-                "open_issues": repo["open_issues_count"],
-                "updated_at": repo["updated_at"],
-                "size": repo.get("size", 0)
-            } for repo in repos[:10]
-        ]
+        "top_repositories": [project_repo(repo) for repo in repos[:10]]
     }
     
     if print_flag:
-        print(f"GitHub Stats for: {data['orgname']} (Organization)")
-        print(f"Name: {data['name'] or 'N/A'}")
-        print(f"Description: {data['description'] or 'N/A'}")
-        print(f"Location: {data['location'] or 'N/A'}")
-        print(f"Public Members: {data['public_members']}")
-        print(f"Followers: {data['followers']}")
-        print(f"Following: {data['following']}")
-        print(f"Public Repos: {data['public_repos']}")
-        print(f"Created At: {data['created_at']}")
+        from tabulate import tabulate
         
-        print("\nTop Repositories (by stars):")
         repo_table = [
             ["Name", "Stars", "Language", "Forks", "Open Issues", "Last Updated"]
         ] + [
-            [repo["name"], repo["stars"], repo["language"] or "N/A", repo["forks"], repo["open_issues"], repo["updated_at"]]
+            [repo["name"], repo["stars"], repo["language"], repo["forks"], repo["open_issues"], repo["updated_at"]]
             for repo in data["top_repositories"]
         ]
-        print(tabulate(repo_table, headers="firstrow", tablefmt="grid"))
+        # Emit the summary and repo table in a single write
+        print(ORG_SUMMARY.format_map({
+            **data,
+            "name": data["name"] or "N/A",
+            "description": data["description"] or "N/A",
+            "location": data["location"] or "N/A",
+            "repo_table": tabulate(repo_table, headers="firstrow", tablefmt="grid"),
+        }))
     
     return data
 
@@ -332,62 +786,51 @@ def display_stats(user_data: Dict[str, Any], repos: list, print_flag: bool = Tru
         "public_repos": user_data['public_repos'],
         "public_gists": user_data['public_gists'],
         "created_at": user_data['created_at'],
-        "top_repositories": [
-            {
-                "name": repo["name"],
-                "stars": repo["stargazers_count"],
-                "language": repo["language"],
-                "forks": repo["forks_count"],
-                "open_issues": repo["open_issues_count"],
-                "updated_at": repo["updated_at"],
-                "size": repo.get("size", 0)
-            } for repo in repos[:10]
-        ]
+        "top_repositories": [project_repo(repo) for repo in repos[:10]]
     }
     
     if print_flag:
-        print(f"GitHub Stats for: {data['username']}")
-        print(f"Name: {data['name'] or 'N/A'}")
-        print(f"Bio: {data['bio'] or 'N/A'}")
-        print(f"Location: {data['location'] or 'N/A'}")
-        print(f"Followers: {data['followers']}")
-        print(f"Following: {data['following']}")
-        print(f"Public Repos: {data['public_repos']}")
-        print(f"Public Gists: {data['public_gists']}")
-        print(f"Account Created: {data['created_at']}")
+        from tabulate import tabulate
         
-        print("\nTop Repositories (by stars):")
         headers = ["Name", "Stars", "Language", "Forks", "Open Issues", "Last Updated"]
         if show_health:
             headers.append("Health Score")
         if show_sizes:
             headers.append("Size (KB)")
         repo_table = [headers]
+        now = datetime.now(timezone.utc)
         for repo in data["top_repositories"]:
-            row = [repo["name"], repo["stars"], repo["language"] or "N/A", repo["forks"], repo["open_issues"], repo["updated_at"]]
+            row = [repo["name"], repo["stars"], repo["language"], repo["forks"], repo["open_issues"], repo["updated_at"]]
             if show_health:
-                # Simple health score calculation
-                health = repo["stars"] * 2 + repo["forks"] * 3 - repo["open_issues"]
-                # Bonus for recent updates (within 30 days)
-                from datetime import datetime, timezone
-                try:
-                    updated = datetime.fromisoformat(repo["updated_at"].replace('Z', '+00:00'))
-                    days_since = (datetime.now(timezone.utc) - updated).days
-                    if days_since <= 30:
-                        health += 10
-                except:
-                    pass
-                row.append(health)
+                row.append(calculate_health_score(repo, now))
             if show_sizes:
                 row.append(repo["size"])
             repo_table.append(row)
-        print(tabulate(repo_table, headers="firstrow", tablefmt="grid"))
+        # Emit the summary and repo table in a single write
+        print(USER_SUMMARY.format_map({
+            **data,
+            "name": data["name"] or "N/A",
+            "bio": data["bio"] or "N/A",
+            "location": data["location"] or "N/A",
+            "repo_table": tabulate(repo_table, headers="firstrow", tablefmt="grid"),
+        }))
         
-        if show_contributors and repos:
-            top_repo = repos[0]
-            contributors = get_repo_contributors(data['username'], top_repo['name'], token)
+        # Fetch the repo-scoped metrics concurrently, then render them in order
+        contributor_futures, activity_future = [], None
+        if (show_contributors or show_activity) and repos:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                if show_contributors:
+                    contributor_futures = [
+                        (repo['name'], executor.submit(get_repo_contributors, data['username'], repo['name'], token))
+                        for repo in repos[:CONTRIBUTOR_REPOS]
+                    ]
+                if show_activity:
+                    activity_future = executor.submit(get_commit_activity, data['username'], repos[0]['name'], token)
+        
+        for repo_name, future in contributor_futures:
+            contributors = future.result()
             if contributors:
-                print(f"\nTop Contributors for {top_repo['name']}:")
+                print(f"\nTop Contributors for {repo_name}:")
                 contrib_table = [
                     ["Username", "Contributions"]
                 ] + [
@@ -396,19 +839,18 @@ def display_stats(user_data: Dict[str, Any], repos: list, print_flag: bool = Tru
                 ]
                 print(tabulate(contrib_table, headers="firstrow", tablefmt="grid"))
         
-        if show_activity and repos:
+        if activity_future is not None:
             top_repo = repos[0]
-            activity = get_commit_activity(data['username'], top_repo['name'], token)
+            activity = activity_future.result()
             if activity:
                 print(f"\nCommit Activity for {top_repo['name']} (last 52 weeks):")
-                total_commits = sum(week['total'] for week in activity)
+                total_commits, recent_weeks = summarize_commit_activity(activity)
                 print(f"Total Commits: {total_commits}")
-                recent_weeks = activity[-12:]  # Last 12 weeks
                 activity_table = [
                     ["Week", "Commits"]
                 ] + [
-                    [f"Week {i+1}", week['total']]
-                    for i, week in enumerate(recent_weeks)
+                    [f"Week {i+1}", commits]
+                    for i, commits in enumerate(recent_weeks)
                 ]
                 print(tabulate(activity_table, headers="firstrow", tablefmt="grid"))
     
@@ -418,10 +860,9 @@ def display_stats(user_data: Dict[str, Any], repos: list, print_flag: bool = Tru
     
     return data
 
-def output_csv(data: Dict[str, Any]):
-    """Output data in CSV format."""
-    output = io.StringIO()
-    writer = csv.writer(output)
+def write_csv(f, data: Dict[str, Any]):
+    """Write user and repository stats as CSV rows to an open file."""
+    writer = csv.writer(f)
     
     # User stats
     writer.writerow(["Type", "Username", "Name", "Bio", "Location", "Followers", "Following", "Public Repos", "Public Gists", "Created At"])
@@ -430,17 +871,52 @@ def output_csv(data: Dict[str, Any]):
     # Repos
     writer.writerow([])
     writer.writerow(["Type", "Name", "Stars", "Language", "Forks", "Open Issues", "Last Updated"])
-    for repo in data["top_repositories"]:
-        writer.writerow(["Repo", repo["name"], repo["stars"], repo["language"], repo["forks"], repo["open_issues"], repo["updated_at"]])
+    writer.writerows(
+        ["Repo", repo["name"], repo["stars"], repo["language"], repo["forks"], repo["open_issues"], repo["updated_at"]]
+        for repo in data["top_repositories"]
+    )
+
+def output_csv(data: Dict[str, Any], path: str = None):
+    """Output data in CSV format, to path if given or else to stdout."""
+    if path:
+        with open(path, "w", newline="", buffering=OUTPUT_BUFFER_SIZE) as f:
+            write_csv(f, data)
+        print(f"CSV saved as '{path}'")
+        return
     
     print("CSV Output:")
-    print(output.getvalue())
+    write_csv(sys.stdout, data)
+    print()
+
+def format_csv(data: Dict[str, Any]) -> str:
+    """Render user and repository stats as a CSV string."""
+    buffer = io.StringIO(newline="")
+    write_csv(buffer, data)
+    return buffer.getvalue()
+
+def format_yaml(data: Dict[str, Any]) -> str:
+    """Render data as a YAML string."""
+    import yaml
+    
+    return yaml.dump(data, default_flow_style=False, allow_unicode=True)
 
 def output_yaml(data: Dict[str, Any]):
     """Output data in YAML format."""
-    yaml_output = yaml.dump(data, default_flow_style=False, allow_unicode=True)
     print("YAML Output:")
-    print(yaml_output)
+    print(format_yaml(data))
+
+def _get_figure(figsize):
+    """Return the shared chart Figure, cleared and resized for the next chart."""
+    global _FIGURE
+    if _FIGURE is None:
+        from matplotlib.figure import Figure
+        
+        # A bare Figure renders through Agg and never touches pyplot's GUI state
+        _FIGURE = Figure()
+    else:
+        _FIGURE.clear()
+    _FIGURE.set_size_inches(figsize)
+    return _FIGURE
 
 def generate_chart(data: Dict[str, Any]):
     """Generate a bar chart of top repositories by stars."""
@@ -449,28 +925,81 @@ def generate_chart(data: Dict[str, Any]):
         print("No repositories to chart.")
         return
     
-    names = [repo["name"] for repo in repos]
-    stars = [repo["stars"] for repo in repos]
-    
-    plt.figure(figsize=(10, 6))
-    plt.bar(names, stars, color='skyblue')
-    plt.xlabel('Repository')
-    plt.ylabel('Stars')
-    plt.title(f'Top Repositories by Stars for {data["username"]}')
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    plt.savefig('github_stats_chart.png')
+    names, stars = zip(*((repo["name"], repo["stars"]) for repo in repos))
+    
+    fig = _get_figure((10, 6))
+    ax = fig.subplots()
+    ax.bar(range(len(names)), stars, color='skyblue')
+    ax.set_xlabel('Repository')
+    ax.set_ylabel('Stars')
+    ax.set_title(f'Top Repositories by Stars for {data["username"]}')
+    ax.set_xticks(range(len(names)))
+    ax.set_xticklabels(names, rotation=45, ha='right')
+    fig.tight_layout()
+    fig.savefig('github_stats_chart.png')
     print("Chart saved as 'github_stats_chart.png'")
 
-def generate_html(data: Dict[str, Any]):
-    """Generate an HTML dashboard."""
-    html = f"""
+SVG_WIDTH, SVG_HEIGHT = 800, 480
+SVG_PLOT = (60, 40, 780, 360)  # left, top, right, bottom of the bar area
+SVG_LABEL_CHARS = 18  # Longest slanted label that stays on the canvas under the first of 10 bars
+
+SVG_HEADER = """<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" font-family="Arial, sans-serif" font-size="12">
+    <text x="{center}" y="24" text-anchor="middle" font-size="16">Top Repositories by Stars for {username}</text>
+    <text x="{left}" y="{top}" text-anchor="end" dx="-6" dy="4">{max_stars}</text>
+    <text x="{left}" y="{bottom}" text-anchor="end" dx="-6" dy="4">0</text>
+    <line x1="{left}" y1="{bottom}" x2="{right}" y2="{bottom}" stroke="#333"/>
+"""
+
+SVG_BAR = """    <rect x="{x:.1f}" y="{y:.1f}" width="{w:.1f}" height="{h:.1f}" fill="skyblue"><title>{name}: {stars}</title></rect>
+    <text x="{cx:.1f}" y="{label_y}" text-anchor="end" transform="rotate(-45 {cx:.1f} {label_y})">{label}</text>
+"""
+_render_svg_bar = SVG_BAR.format_map
+
+SVG_FOOTER = "</svg>\n"
+
+def _svg_label(name: str) -> str:
+    """Escape a repository name for an axis label, ellipsizing it past SVG_LABEL_CHARS."""
+    if len(name) <= SVG_LABEL_CHARS:
+        return html.escape(name)
+    return html.escape(name[:SVG_LABEL_CHARS - 1]) + "&#8230;"
+
+def generate_svg_chart(data: Dict[str, Any]):
+    """Write the top-repositories bar chart as plain SVG, without matplotlib."""
+    repos = data["top_repositories"]
+    if not repos:
+        print("No repositories to chart.")
+        return
+    
+    left, top, right, bottom = SVG_PLOT
+    max_stars = max(repo["stars"] for repo in repos)
+    slot = (right - left) / len(repos)
+    scale = (bottom - top) / (max_stars or 1)
+    with open("github_stats_chart.svg", "w", buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.write(SVG_HEADER.format(
+            width=SVG_WIDTH, height=SVG_HEIGHT, center=SVG_WIDTH // 2, username=html.escape(data["username"]),
+            left=left, top=top, right=right, bottom=bottom, max_stars=max_stars,
+        ))
+        f.writelines(_render_svg_bar({
+            "x": left + i * slot + slot * 0.1,
+            "y": bottom - repo["stars"] * scale,
+            "w": slot * 0.8,
+            "h": repo["stars"] * scale,
+            "cx": left + (i + 0.5) * slot,
+            "label_y": bottom + 14,
+            "name": html.escape(repo["name"]),
+            "label": _svg_label(repo["name"]),
+            "stars": repo["stars"],
+        }) for i, repo in enumerate(repos))
+        f.write(SVG_FOOTER)
+    print("Chart saved as 'github_stats_chart.svg'")
+
+HTML_HEADER = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GitHub Stats Dashboard - {data["username"]}</title>
+    <title>GitHub Stats Dashboard - {username}</title>
     <style>
         body {{ font-family: Arial, sans-serif; margin: 20px; }}
         h1 {{ color: #333; }}
@@ -482,30 +1011,51 @@ def generate_html(data: Dict[str, Any]):
     </style>
 </head>
 <body>
-    <h1>GitHub Stats Dashboard for {data["username"]}</h1>
+    <h1>GitHub Stats Dashboard for {username}</h1>
     <div class="stats">
-        <div class="stat"><strong>Name:</strong> {data.get("name", "N/A")}</div>
-        <div class="stat"><strong>Bio:</strong> {data.get("bio", "N/A")}</div>
-        <div class="stat"><strong>Location:</strong> {data.get("location", "N/A")}</div>
-        <div class="stat"><strong>Followers:</strong> {data["followers"]}</div>
-        <div class="stat"><strong>Following:</strong> {data["following"]}</div>
-        <div class="stat"><strong>Public Repos:</strong> {data["public_repos"]}</div>
-        <div class="stat"><strong>Public Gists:</strong> {data["public_gists"]}</div>
-        <div class="stat"><strong>Account Created:</strong> {data["created_at"]}</div>
+        <div class="stat"><strong>Name:</strong> {name}</div>
+        <div class="stat"><strong>Bio:</strong> {bio}</div>
+        <div class="stat"><strong>Location:</strong> {location}</div>
+        <div class="stat"><strong>Followers:</strong> {followers}</div>
+        <div class="stat"><strong>Following:</strong> {following}</div>
+        <div class="stat"><strong>Public Repos:</strong> {public_repos}</div>
+        <div class="stat"><strong>Public Gists:</strong> {public_gists}</div>
+        <div class="stat"><strong>Account Created:</strong> {created_at}</div>
     </div>
     <h2>Top Repositories</h2>
     <table>
         <tr><th>Name</th><th>Stars</th><th>Language</th><th>Forks</th><th>Open Issues</th><th>Last Updated</th></tr>
-        {"".join(f"<tr><td>{repo['name']}</td><td>{repo['stars']}</td><td>{repo['language'] or 'N/A'}</td><td>{repo['forks']}</td><td>{repo['open_issues']}</td><td>{repo['updated_at']}</td></tr>" for repo in data["top_repositories"])}
-    </table>
+"""
+
+HTML_ROW = "        <tr><td>{name}</td><td>{stars}</td><td>{language}</td><td>{forks}</td><td>{open_issues}</td><td>{updated_at}</td></tr>\n"
+_render_html_row = HTML_ROW.format_map
+
+HTML_FOOTER = """    </table>
     <!-- If chart exists, embed it -->
     <h2>Chart</h2>
     <img src="github_stats_chart.png" alt="Repository Stars Chart" style="max-width: 100%;">
 </body>
 </html>
 """
-    with open("github_stats_dashboard.html", "w") as f:
-        f.write(html)
+
+def generate_html(data: Dict[str, Any]):
+    """Generate an HTML dashboard, writing it out row by row."""
+    header = {
+        **data,
+        "username": html.escape(data["username"]),
+        "name": html.escape(data.get("name") or "N/A"),
+        "bio": html.escape(data.get("bio") or "N/A"),
+        "location": html.escape(data.get("location") or "N/A"),
+    }
+    # The buffer holds a typical dashboard, so the row-by-row writes reach disk in one go
+    with open("github_stats_dashboard.html", "w", buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.write(HTML_HEADER.format_map(header))
+        f.writelines(_render_html_row({
+            **repo,
+            "name": html.escape(repo["name"]),
+            "language": html.escape(repo["language"]),
+        }) for repo in data["top_repositories"])
+        f.write(HTML_FOOTER)
     print("Dashboard saved as 'github_stats_dashboard.html'")
 
 def generate_pie_chart(data: Dict[str, Any]):
@@ -515,30 +1065,66 @@ def generate_pie_chart(data: Dict[str, Any]):
         print("No repositories to chart.")
         return
     
-    languages = {}
-    for repo in repos:
-        lang = repo["language"] or "Others"
-        languages[lang] = languages.get(lang, 0) + 1
+    languages = Counter(repo["language"] for repo in repos)
+    if "N/A" in languages:
+        languages["Others"] = languages.pop("N/A")
     
     labels = list(languages.keys())
     sizes = list(languages.values())
     
-    plt.figure(figsize=(8, 8))
-    plt.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=140)
-    plt.title(f'Programming Languages Distribution for {data["username"]}')
-    plt.axis('equal')
-    plt.savefig('github_languages_pie.png')
+    fig = _get_figure((8, 8))
+    ax = fig.subplots()
+    ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=140)
+    ax.set_title(f'Programming Languages Distribution for {data["username"]}')
+    ax.axis('equal')
+    fig.savefig('github_languages_pie.png')
     print("Pie chart saved as 'github_languages_pie.png'")
 
-def compare_users(usernames: list, token: str = None, max_repos: int = 10):
-    """Compare stats of multiple users."""
+COMPARE_STATS = [
+    ("Name", "name"),
+    ("Followers", "followers"),
+    ("Following", "following"),
+    ("Public Repos", "public_repos"),
+    ("Public Gists", "public_gists"),
+    ("Account Created", "created_at"),
+]
+
+def _submit_user_fetch(executor, username: str, token: str = None, max_repos: int = 10, since: str = None, search: bool = False):
+    """Start fetching a user's profile and top repositories in parallel; returns both futures.
+
+    With search, the repositories come from the search API, ranked by stars.
+    """
+    if search:
+        repos_future = executor.submit(search_user_repos, username, max_repos, token)
+    else:
+        repos_future = executor.submit(get_user_repos, username, max_repos, token, since)
+    return executor.submit(get_user_stats, username, token), repos_future
+
+def fetch_user(username: str, token: str = None, max_repos: int = 10, since: str = None, search: bool = False):
+    """Fetch a user's profile and top repositories concurrently over REST."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        user_future, repos_future = _submit_user_fetch(executor, username, token, max_repos, since, search)
+        return user_future.result(), repos_future.result()
+
+def fetch_org(orgname: str, token: str = None, max_repos: int = 10, since: str = None):
+    """Fetch an organization's profile and top repositories concurrently."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        org_future = executor.submit(get_org_stats, orgname, token)
+        repos_future = executor.submit(get_org_repos, orgname, max_repos, token, since)
+        return org_future.result(), repos_future.result()
+
+def _fetch_compare_rest(usernames: list, token: str = None, max_repos: int = 10):
+    """Fetch compared users over the REST API in parallel; returns None after reporting an error."""
+    from tqdm import tqdm
+    
     user_data_list = []
-    with tqdm(total=len(usernames), desc="Fetching user data") as pbar:
-        for username in usernames:
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, 2 * len(usernames))) as executor, \
+            tqdm(total=len(usernames), desc="Fetching user data", file=sys.stderr, disable=not sys.stderr.isatty()) as pbar:
+        # Issue every profile and repos request up front, then collect in input order
+        futures = [(username, *_submit_user_fetch(executor, username, token, max_repos)) for username in usernames]
+        for username, user_future, repos_future in futures:
             try:
-                user_data = get_user_stats(username, token)
-                repos = get_user_repos(username, max_repos, token)
-                data = display_stats(user_data, repos, False)  # Don't print individual
+                data = display_stats(user_future.result(), repos_future.result(), False)  # Don't print individual
                 user_data_list.append(data)
                 pbar.set_postfix_str(f"Processed {username}")
             except ValueError as e:
@@ -546,39 +1132,61 @@ def compare_users(usernames: list, token: str = None, max_repos: int = 10):
                 return
             pbar.update(1)
     
+    return user_data_list
+
+def compare_users(usernames: list, token: str = None, max_repos: int = 10):
+    """Compare stats of multiple users."""
+    from tabulate import tabulate
+    
+    user_data_list = None
+    if token:
+        # One aliased GraphQL query replaces the 2N REST calls; any failure (an org login,
+        # a query error) falls back to per-user REST, which reports which login failed
+        try:
+            bundles = get_users_bundle_graphql(usernames, max_repos, token)
+            if None not in bundles:
+                user_data_list = [display_stats(user_data, repos, False) for user_data, repos in bundles]
+        except ValueError:
+            pass
+    if user_data_list is None:
+        user_data_list = _fetch_compare_rest(usernames, token, max_repos)
+        if user_data_list is None:
+            return
+    
     # Create comparison table
     headers = ["Stat"] + usernames
-    table = [
-        ["Name", *[d.get("name", "N/A") for d in user_data_list]],
-        ["Followers", *[d["followers"] for d in user_data_list]],
-        ["Following", *[d["following"] for d in user_data_list]],
-        ["Public Repos", *[d["public_repos"] for d in user_data_list]],
-        ["Public Gists", *[d["public_gists"] for d in user_data_list]],
-        ["Account Created", *[d["created_at"] for d in user_data_list]],
-    ]
+    # One pass row-per-user, then transpose into one column per stat
+    keys = [key for _, key in COMPARE_STATS]
+    columns = zip(*([d.get(key, "N/A") for key in keys] for d in user_data_list))
+    table = [[label, *column] for (label, _), column in zip(COMPARE_STATS, columns)]
     print("\nUser Comparison:")
     print(tabulate(table, headers=headers, tablefmt="grid"))
 
+@lru_cache(maxsize=1)
+def load_config() -> Dict[str, Any]:
+    """Read config.json defaults once, or return an empty config if there is none."""
+    try:
+        with open("config.json", "rb") as f:
+            return json_loads(f.read())
+    except FileNotFoundError:
+        return {}
+
 def main():
-    # Load config
-    config = {}
-    if os.path.exists("config.json"):
-        with open("config.json", "r") as f:
-            config = json.load(f)
-    
     parser = argparse.ArgumentParser(description="Fetch GitHub user statistics.")
     parser.add_argument("username", nargs='?', help="GitHub username to fetch stats for (use --compare for multiple)")
-    parser.add_argument("--max-repos", type=int, default=config.get("default_max_repos", 10), help="Max number of repos to display (default: 10)")
+    parser.add_argument("--max-repos", type=int, help="Max number of repos to display (default: 10)")
     parser.add_argument("--json", action="store_true", help="Output in JSON format")
     parser.add_argument("--csv", action="store_true", help="Output in CSV format")
+    parser.add_argument("--csv-file", metavar="FILE", help="Save the CSV output to FILE instead of printing it")
     parser.add_argument("--chart", action="store_true", help="Generate a bar chart of top repositories by stars")
-    parser.add_argument("--token", default=config.get("default_token", ""), help="GitHub personal access token for authentication (optional)")
+    parser.add_argument("--svg", action="store_true", help="Generate the bar chart as SVG (no matplotlib needed)")
+    parser.add_argument("--token", help="GitHub personal access token for authentication (optional)")
     parser.add_argument("--compare", nargs='+', help="Compare stats of multiple users")
     parser.add_argument("--html", action="store_true", help="Generate an HTML dashboard")
     parser.add_argument("--pie", action="store_true", help="Generate a pie chart of programming languages")
     parser.add_argument("--org", help="Get stats for organization instead of user")
     parser.add_argument("--since", help="Filter repos updated since date (YYYY-MM-DD)")
-    parser.add_argument("--contributors", action="store_true", help="Show top contributors for the top repository")
+    parser.add_argument("--contributors", action="store_true", help="Show top contributors for the top 3 repositories")
     parser.add_argument("--activity", action="store_true", help="Show commit activity for top repositories")
     parser.add_argument("--yaml", action="store_true", help="Output in YAML format")
     parser.add_argument("--rate-limit", action="store_true", help="Show current GitHub API rate limit status")
@@ -588,6 +1196,13 @@ def main():
     parser.add_argument("--sizes", action="store_true", help="Show repository sizes and file counts")
     args = parser.parse_args()
     
+    # Only fall back to config.json for options not given on the command line
+    if args.max_repos is None:
+        args.max_repos = load_config().get("default_max_repos", 10)
+    args.max_repos = clamp_max_repos(args.max_repos)
+    if args.token is None:
+        args.token = load_config().get("default_token", "")
+    
     if args.rate_limit:
         rate_limit_data = get_rate_limit(args.token)
         if rate_limit_data:
@@ -604,7 +1219,7 @@ def main():
         print("Launching web interface...")
         print("Open http://localhost:5000 in your browser")
         from web_app import app
-        app.run(debug=True, host='0.0.0.0', port=5000)
+        app.run(host='0.0.0.0', port=5000)
         return
     
     is_org = False
@@ -622,6 +1237,8 @@ def main():
     if args.history:
         history = get_user_history(usernames[0], args.history)
         if history:
+            from tabulate import tabulate
+            
             print(f"Historical data for {usernames[0]} (last {args.history} days):")
             history_table = [
                 ["Date", "Followers", "Following", "Public Repos", "Public Gists"]
@@ -639,28 +1256,40 @@ def main():
             compare_users(usernames, args.token, args.max_repos)
         else:
             if is_org:
-                org_data = get_org_stats(usernames[0], args.token)
-                repos = get_org_repos(usernames[0], args.max_repos, args.token, args.since)
-                data = display_org_stats(org_data, repos, not (args.json or args.csv or args.chart or args.html or args.pie))
+                org_data, repos = fetch_org(usernames[0], args.token, args.max_repos, args.since)
+                data = display_org_stats(org_data, repos, not (args.json or args.csv or args.chart or args.svg or args.html or args.pie))
             else:
-                user_data = get_user_stats(usernames[0], args.token)
-                repos = get_user_repos(usernames[0], args.max_repos, args.token, args.since)
-                data = display_stats(user_data, repos, not (args.json or args.csv or args.chart or args.html or args.pie or args.yaml), args.contributors, args.token, args.activity, args.health, args.sizes)
+                bundle = None
+                if args.token and not args.since:
+                    # One GraphQL round-trip replaces the profile + repos REST calls
+                    try:
+                        bundle = get_user_bundle_graphql(usernames[0], args.max_repos, args.token)
+                    except ValueError:
+                        bundle = None  # e.g. the GraphQL points budget is spent; REST has its own
+                if bundle is None:
+                    # Organizations are not GraphQL users; REST serves them and reports unknown logins
+                    bundle = fetch_user(usernames[0], args.token, args.max_repos, args.since)
+                user_data, repos = bundle
+                data = display_stats(user_data, repos, not (args.json or args.csv or args.chart or args.svg or args.html or args.pie or args.yaml), args.contributors, args.token, args.activity, args.health, args.sizes)
             if args.json:
-                print(json.dumps(data, indent=4))
-            if args.csv:
-                output_csv(data)
+                # Hand orjson's bytes straight to stdout instead of decoding them back to str
+                sys.stdout.flush()
+                sys.stdout.buffer.write(json_dumpb(data, pretty=True) + b"\n")
+            if args.csv or args.csv_file:
+                output_csv(data, args.csv_file)
             if args.yaml:
                 output_yaml(data)
             if args.chart:
                 generate_chart(data)
+            if args.svg:
+                generate_svg_chart(data)
             if args.html:
                 generate_html(data)
             if args.pie:
                 generate_pie_chart(data)
     except ValueError as e:
         print(f"Error: {e}")
-    except requests.RequestException as e:
+    except NETWORK_ERRORS as e:  # Looked up once raised, after the client exists
         print(f"Network error: {e}")
 
 if __name__ == "__main__":
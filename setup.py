@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
     name="github-stats-cli",
     version="0.1.0",
-    py_modules=['github_stats_cli'],
+    py_modules=['github_stats_cli', 'web_app'],
     entry_points={
         'console_scripts': [
             'github-stats=github_stats_cli:main',
@@ -12,6 +12,11 @@ setup(
     install_requires=[
         'requests',
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'compression': ['brotli', 'zstandard'],
+        'web': ['flask', 'gunicorn', 'gevent'],
+    },
     author="Amar Kumar",
     description="A CLI tool to fetch GitHub user statistics",
     url="https://github.com/amarzeus/github-stats-cli",
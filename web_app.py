@@ -5,22 +5,79 @@ A web interface for the GitHub Stats CLI tool.
 """
 
 from flask import Flask, render_template, request, jsonify
-import json
-import os
-import sys
-
-# Add the current directory to the path so we can import the CLI functions
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from flask.json.provider import DefaultJSONProvider
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import threading
+import time
 
+import github_stats_cli
 from github_stats_cli import (
-    get_user_stats, get_user_repos, display_stats,
-    get_org_stats, get_org_repos, display_org_stats,
-    compare_users, output_yaml, output_csv
+    display_stats, fetch_user, get_users_bundle_graphql, display_org_stats, fetch_org,
+    format_yaml, format_csv, clamp_max_repos, MAX_WORKERS, orjson
 )
 
+RESPONSE_TTL = 60  # Seconds a rendered API response is served as-is
+RESPONSE_CACHE_SIZE = 256  # Rendered responses kept before the oldest is evicted
+
+_RESPONSES = {}
+_RESPONSES_LOCK = threading.Lock()
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses straight to bytes with orjson when it is installed."""
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_APPEND_NEWLINE
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(orjson.dumps(obj, option=option), mimetype=self.mimetype)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = 'github-stats-web'
 
+def warm_templates():
+    """Compile every template into Jinja's cache, so no request (or gunicorn --preload fork) pays for parsing."""
+    for template_name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(template_name)
+
+warm_templates()
+
+def render_stats(data, format_type):
+    """Serialize stats data to (body bytes, mimetype) for the requested format."""
+    if format_type == 'yaml':
+        return format_yaml(data).encode(), 'text/plain'
+    elif format_type == 'csv':
+        return format_csv(data).encode(), 'text/csv'
+    return jsonify(data).get_data(), 'application/json'
+
+def cached_response(key, build):
+    """Serve a rendered response body from memory, calling build() for (body, mimetype) on a miss.
+
+    Bodies carry an ETag, so clients that send If-None-Match get an empty 304.
+    """
+    now = time.time()
+    with _RESPONSES_LOCK:
+        entry = _RESPONSES.get(key)
+    if entry is None or entry[0] < now:
+        body, mimetype = build()
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        entry = (now + RESPONSE_TTL, body, mimetype, etag)
+        with _RESPONSES_LOCK:
+            _RESPONSES.pop(key, None)
+            if len(_RESPONSES) >= RESPONSE_CACHE_SIZE:
+                _RESPONSES.pop(next(iter(_RESPONSES)))
+            _RESPONSES[key] = entry
+    _, body, mimetype, etag = entry
+    response = app.response_class(body, mimetype=mimetype)
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -30,22 +87,16 @@ def get_stats(username):
     """API endpoint to get user stats."""
     token = request.args.get('token', '')
     format_type = request.args.get('format', 'json')
-    max_repos = int(request.args.get('max_repos', 10))
+    max_repos = clamp_max_repos(request.args.get('max_repos', 10, type=int))
     since = request.args.get('since', None)
     show_health = request.args.get('health', 'false').lower() == 'true'
 
-    try:
-        user_data = get_user_stats(username, token)
-        repos = get_user_repos(username, max_repos, token, since)
-        data = display_stats(user_data, repos, False, show_health=show_health)
-
-        if format_type == 'yaml':
-            return output_yaml(data), 200, {'Content-Type': 'text/plain'}
-        elif format_type == 'csv':
-            return output_csv(data), 200, {'Content-Type': 'text/csv'}
-        else:
-            return jsonify(data)
+    def build():
+        user_data, repos = fetch_user(username, token, max_repos, since)
+        return render_stats(display_stats(user_data, repos, False, show_health=show_health), format_type)
 
+    try:
+        return cached_response(('user', username, token, max_repos, since, show_health, format_type), build)
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
 
@@ -54,21 +105,15 @@ def get_org_stats_api(orgname):
     """API endpoint to get organization stats."""
     token = request.args.get('token', '')
     format_type = request.args.get('format', 'json')
-    max_repos = int(request.args.get('max_repos', 10))
+    max_repos = clamp_max_repos(request.args.get('max_repos', 10, type=int))
     since = request.args.get('since', None)
 
-    try:
-        org_data = get_org_stats(orgname, token)
-        repos = get_org_repos(orgname, max_repos, token, since)
-        data = display_org_stats(org_data, repos, False)
-
-        if format_type == 'yaml':
-            return output_yaml(data), 200, {'Content-Type': 'text/plain'}
-        elif format_type == 'csv':
-            return output_csv(data), 200, {'Content-Type': 'text/csv'}
-        else:
-            return jsonify(data)
+    def build():
+        org_data, repos = fetch_org(orgname, token, max_repos, since)
+        return render_stats(display_org_stats(org_data, repos, False), format_type)
 
+    try:
+        return cached_response(('org', orgname, token, max_repos, since, format_type), build)
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
 
@@ -78,27 +123,49 @@ def compare_users_api():
     usernames = request.args.get('users', '').split(',')
     usernames = [u.strip() for u in usernames if u.strip()]
     token = request.args.get('token', '')
-    max_repos = int(request.args.get('max_repos', 10))
+    max_repos = clamp_max_repos(request.args.get('max_repos', 10, type=int))
 
     if len(usernames) < 2:
         return jsonify({'error': 'At least 2 users required for comparison'}), 400
 
-    try:
-        # For API, we'll return the data structure instead of printing
-        user_data_list = []
-        for username in usernames:
-            user_data = get_user_stats(username, token)
-            repos = get_user_repos(username, max_repos, token)
-            data = display_stats(user_data, repos, False)
-            user_data_list.append(data)
-
-        return jsonify({
-            'comparison': user_data_list,
-            'users': usernames
-        })
-
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+    def fetch_one(username):
+        """Fetch one user's comparison data, capturing the error instead of raising it."""
+        try:
+            # Search ranks by stars but has its own small quota (10/min anonymous), so only
+            # spend it when a token raises that limit; anonymous compares stay on the core quota
+            user_data, repos = fetch_user(username, token, max_repos, search=bool(token))
+            return display_stats(user_data, repos, False), None
+        except ValueError as e:
+            return None, str(e)
+        except github_stats_cli.NETWORK_ERRORS as e:  # Set once the client exists, so looked up here
+            return None, f"Network error: {e}"
+
+    results = None
+    if token:
+        # One aliased GraphQL document covers every user; a login that is not a user or a
+        # failed query falls back to per-user REST below, which reports which one failed
+        try:
+            bundles = get_users_bundle_graphql(usernames, max_repos, token)
+            if None not in bundles:
+                results = [(display_stats(user_data, repos, False), None) for user_data, repos in bundles]
+        except ValueError:
+            pass
+    if results is None:
+        # Fetch every user at once so all 2N requests share the pooled (HTTP/2 when available) client
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(usernames))) as executor:
+            results = list(executor.map(fetch_one, usernames))
+
+    # One bad username drops out of the comparison instead of failing it
+    user_data_list = [data for data, _ in results if data is not None]
+    errors = {username: error for username, (_, error) in zip(usernames, results) if error is not None}
+    if len(user_data_list) < 2:
+        return jsonify({'error': 'At least 2 valid users required for comparison', 'errors': errors}), 400
+
+    return jsonify({
+        'comparison': user_data_list,
+        'users': [username for username in usernames if username not in errors],
+        'errors': errors
+    })
 
 @app.route('/stats/<username>')
 def stats_page(username):
@@ -116,4 +183,5 @@ def compare_page():
     return render_template('compare.html')
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server only (FLASK_DEBUG=1 enables the debugger); see the README for gunicorn
+    app.run(host='0.0.0.0', port=5000)